@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Session Export CLI
+Batch-exports sessions to Markdown or HTML without the browser.
+
+Usage:
+    python3 export.py --project <project> [--session ID ...] [--format md|html]
+                      [--include-agents] [--out DIR] [--jobs N]
+
+Project directory names start with '-' (e.g. -home-u-proj), so the project is
+taken as an option value; both --project=-home-u-proj and
+--project -home-u-proj work.
+"""
+
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Add server directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from server.utils.discovery import get_projects_dir
+from server.utils.export import export_project_session, get_renderer
+
+def export_to_file(project_path, session_id, fmt, include_agents, no_thinking, out_dir):
+    """Export one session to <out_dir>/<session_id>.<ext>, returning the path."""
+    out_path = os.path.join(out_dir, f"{session_id}.{get_renderer(fmt).extension}")
+    chunks = export_project_session(project_path, session_id, fmt, include_agents, no_thinking)
+
+    with open(out_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+    return out_path
+
+def list_session_ids(project_path):
+    """All top-level session files in a project (agent files excluded)."""
+    return sorted(
+        name[:-6] for name in os.listdir(project_path)
+        if name.endswith('.jsonl') and not name.startswith('agent-')
+    )
+
+def join_project_arg(argv):
+    """Rewrite '--project -name' as '--project=-name' so argparse accepts it."""
+    args = []
+    i = 0
+    while i < len(argv):
+        if argv[i] == '--project' and i + 1 < len(argv):
+            args.append(f"--project={argv[i + 1]}")
+            i += 2
+        else:
+            args.append(argv[i])
+            i += 1
+    return args
+
+def main():
+    parser = argparse.ArgumentParser(description='Export Claude sessions to Markdown or HTML.')
+    parser.add_argument('--project', required=True,
+                        help='Project directory name under ~/.claude/projects')
+    parser.add_argument('--session', action='append', dest='sessions',
+                        help='Session ID to export (repeatable; default: all sessions)')
+    parser.add_argument('--format', default='md', choices=['md', 'html'])
+    parser.add_argument('--include-agents', action='store_true')
+    parser.add_argument('--no-thinking', action='store_true')
+    parser.add_argument('--out', default='.', help='Output directory')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Sessions exported in parallel')
+    args = parser.parse_args(join_project_arg(sys.argv[1:]))
+
+    project_path = os.path.join(get_projects_dir(), os.path.basename(args.project))
+    if not os.path.isdir(project_path):
+        print(f"❌ Project not found: {args.project}")
+        return 1
+
+    session_ids = args.sessions or list_session_ids(project_path)
+    os.makedirs(args.out, exist_ok=True)
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+        futures = {
+            session_id: executor.submit(
+                export_to_file, project_path, os.path.basename(session_id), args.format,
+                args.include_agents, args.no_thinking, args.out
+            )
+            for session_id in session_ids
+        }
+
+        for session_id, future in futures.items():
+            try:
+                print(f"✅ {future.result()}")
+            except Exception as e:
+                failed += 1
+                print(f"❌ {session_id}: {e}")
+
+    print(f"\nExported {len(session_ids) - failed}/{len(session_ids)} sessions")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
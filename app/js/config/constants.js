@@ -6,6 +6,7 @@
 export const APP_CONFIG = {
   API_URL: 'http://localhost:8000',
   API_TIMEOUT: 30000,
+  COMPACT_WIRE_FORMAT: false,
   
   STORAGE_KEY: 'claude-session-viewer',
   MAX_RECENT_SESSIONS: 10,
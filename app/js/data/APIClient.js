@@ -12,6 +12,7 @@ export class APIClient extends Module {
     super(options);
     this.baseUrl = options.baseUrl || 'http://localhost:8000';
     this.timeout = options.timeout || 30000;
+    this.compact = options.compact || false;
   }
 
   /**
@@ -75,6 +76,15 @@ export class APIClient extends Module {
    */
   async loadSession(project, sessionId) {
     const params = new URLSearchParams({ project, sessionId });
+    if (this.compact) params.set('format', 'compact');
+    return this.decodeResponse(await this.request(`/api/session?${params}`));
+  }
+
+  /**
+   * Load a session outline (prompts, turns, tools, agent spawns; no content)
+   */
+  async loadSessionOutline(project, sessionId) {
+    const params = new URLSearchParams({ project, sessionId, mode: 'outline' });
     return this.request(`/api/session?${params}`);
   }
 
@@ -84,7 +94,53 @@ export class APIClient extends Module {
    */
   async loadSubAgent(project, sessionId, agentId, agentType = 'nested') {
     const params = new URLSearchParams({ project, sessionId, agentId, type: agentType });
-    return this.request(`/api/subagent?${params}`);
+    if (this.compact) params.set('format', 'compact');
+    return this.decodeResponse(await this.request(`/api/subagent?${params}`));
+  }
+
+  /**
+   * Expand a format=compact response into the regular { events } shape
+   */
+  decodeResponse(data) {
+    if (data.format !== 'compact') return data;
+
+    const { compact, format, ...rest } = data;
+    return { ...rest, events: this.decodeCompact(compact) };
+  }
+
+  /**
+   * Decode compact wire format (see server/utils/compact.py).
+   * Objects are [shape, ...values], arrays are [-1, ...values] (an event may
+   * be either, or a plain value); each shape entry is (string index << 2) | kind
+   * with kind 0 = raw value, 1 = string table index, 2 = hoisted constant.
+   */
+  decodeCompact({ strings, shapes, constants, events }) {
+    const decodeValue = (value) => {
+      if (!Array.isArray(value)) return value;
+      if (value[0] !== -1) return decodeObject(value);
+
+      const items = new Array(value.length - 1);
+      for (let i = 1; i < value.length; i++) {
+        items[i - 1] = decodeValue(value[i]);
+      }
+      return items;
+    };
+
+    const decodeObject = (tuple) => {
+      const obj = {};
+      let slot = 1;
+      for (const entry of shapes[tuple[0]]) {
+        const key = strings[entry >> 2];
+        switch (entry & 3) {
+          case 0: obj[key] = decodeValue(tuple[slot++]); break;
+          case 1: obj[key] = strings[tuple[slot++]]; break;
+          case 2: obj[key] = constants[key]; break;
+        }
+      }
+      return obj;
+    };
+
+    return events.map(decodeValue);
   }
 
   /**
@@ -96,6 +152,24 @@ export class APIClient extends Module {
     return this.request(`/api/agents?${params}`);
   }
 
+  /**
+   * URL for a server-side streamed export (download directly, bypasses tab memory)
+   * @param {string} format - 'md' or 'html'
+   */
+  getExportUrl(project, sessionId, format = 'md', includeAgents = true) {
+    const params = new URLSearchParams({
+      project, sessionId, format, includeAgents: includeAgents ? '1' : '0'
+    });
+    return `${this.baseUrl}/api/export?${params}`;
+  }
+
+  /**
+   * Background indexer progress
+   */
+  async getIndexerStatus() {
+    return this.request('/api/indexer');
+  }
+
   /**
    * Health check
    */
@@ -81,7 +81,8 @@ class App {
 
   initDataLayer() {
     this.modules.api = new APIClient({
-      baseUrl: this.modules.config.get('API_URL')
+      baseUrl: this.modules.config.get('API_URL'),
+      compact: this.modules.config.get('COMPACT_WIRE_FORMAT')
     });
     
     this.modules.parser = new SessionParser();
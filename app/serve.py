@@ -11,22 +11,31 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from server.handler import SessionViewerHandler
-from http.server import HTTPServer
+from server.indexer import start_indexer, stop_indexer
+from http.server import ThreadingHTTPServer
 
 PORT = int(os.environ.get('PORT', 8000))
+INDEXER_ENABLED = os.environ.get('INDEXER', '1') != '0'
 
 def main():
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
-    server = HTTPServer(('', PORT), SessionViewerHandler)
+    # Threaded so long streaming exports don't block other requests
+    server = ThreadingHTTPServer(('', PORT), SessionViewerHandler)
     print(f"✅ Server running at http://localhost:{PORT}/")
     print(f"📂 Serving files from: {os.getcwd()}")
     print(f"🌐 Open http://localhost:{PORT}/index.html in your browser")
+    
+    if INDEXER_ENABLED:
+        start_indexer()
+        print("🔎 Background indexer warming caches (progress: /api/indexer)")
+    
     print(f"\nPress Ctrl+C to stop the server")
     
     try:
         server.serve_forever()
     except KeyboardInterrupt:
+        stop_indexer()
         print("\n\n👋 Server stopped")
 
 if __name__ == '__main__':
@@ -6,7 +6,7 @@ Routes requests to appropriate handlers.
 import http.server
 import urllib.parse
 import json
-from .routes import projects, sessions, session, subagent, agents
+from .routes import projects, sessions, session, subagent, agents, export, indexer
 
 class SessionViewerHandler(http.server.SimpleHTTPRequestHandler):
     """Main request handler with API routing."""
@@ -18,6 +18,8 @@ class SessionViewerHandler(http.server.SimpleHTTPRequestHandler):
         'session': session.handle,
         'subagent': subagent.handle,
         'agents': agents.handle,
+        'export': export.handle,
+        'indexer': indexer.handle,
         'health': lambda h, p: h.send_json({'status': 'ok'})
     }
     
@@ -47,17 +49,75 @@ class SessionViewerHandler(http.server.SimpleHTTPRequestHandler):
         else:
             self.send_error_json(404, f"Unknown endpoint: {endpoint}")
     
-    def send_json(self, data, status=200):
-        """Send JSON response."""
-        body = json.dumps(data).encode('utf-8')
+    def send_json(self, data, status=200, compact=False, raw=None):
+        """Send JSON response (without whitespace if compact).
+        
+        raw maps extra top-level keys to values already encoded as JSON, given
+        as a list of bytes pieces; they are written out without re-encoding.
+        """
+        separators = (',', ':') if compact else None
+        body = json.dumps(data, separators=separators).encode('utf-8')
+        pieces = [body]
+        if raw:
+            pieces = [body[:-1]]
+            for key, value in raw.items():
+                if len(pieces) > 1 or data:
+                    pieces.append(b', ')
+                pieces.append(json.dumps(key).encode('utf-8') + b': ')
+                pieces.extend(value)
+            pieces.append(b'}')
+        
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', len(body))
+        self.send_header('Content-Length', sum(len(piece) for piece in pieces))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
-        self.wfile.write(body)
+        for piece in pieces:
+            self.wfile.write(piece)
+    
+    def send_stream(self, chunks, content_type, filename=None, buffer_size=64 * 1024):
+        """Send an iterable of text chunks using chunked transfer encoding."""
+        # Chunked encoding needs HTTP/1.1; the connection is closed afterwards
+        # rather than kept alive, like the HTTP/1.0 responses.
+        self.protocol_version = 'HTTP/1.1'
+        self.close_connection = True
+        
+        self.send_response(200)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Connection', 'close')
+        if filename:
+            self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        
+        buffer = []
+        buffered = 0
+        try:
+            for chunk in chunks:
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= buffer_size:
+                    self.write_chunk(''.join(buffer).encode('utf-8'))
+                    buffer = []
+                    buffered = 0
+        except Exception:
+            # Headers are already sent; leave the stream unterminated so the
+            # client sees a truncated response rather than a partial document.
+            import traceback
+            traceback.print_exc()
+            return
+        
+        if buffer:
+            self.write_chunk(''.join(buffer).encode('utf-8'))
+        self.wfile.write(b'0\r\n\r\n')
+    
+    def write_chunk(self, data):
+        """Write one chunk in chunked transfer encoding."""
+        if data:
+            self.wfile.write(f'{len(data):X}\r\n'.encode('ascii') + data + b'\r\n')
     
     def send_error_json(self, status, message, code=None):
         """Send error as JSON."""
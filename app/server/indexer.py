@@ -0,0 +1,305 @@
+"""
+Background indexer.
+Warms discovery caches off the request path, most recently modified projects
+first, and keeps them fresh by periodically diffing directory snapshots.
+"""
+
+import os
+import time
+import threading
+import traceback
+from datetime import datetime
+from .utils.discovery import (
+    get_projects_dir, count_sessions, load_sessions_from_index,
+    list_sessions_from_directory, agent_session_ids,
+    forget_paths, forget_project
+)
+from .utils.outline import build_outline
+
+# Seconds between scans. Override with INDEXER_INTERVAL.
+SCAN_INTERVAL = float(os.environ.get('INDEXER_INTERVAL', 30))
+
+# Fraction of wall time the indexer may spend working; after each unit of
+# work it sleeps long enough to stay under it. Override with INDEXER_DUTY_CYCLE.
+DUTY_CYCLE = float(os.environ.get('INDEXER_DUTY_CYCLE', 0.2))
+
+# Most recent sessions (across all projects) whose outlines are pre-built
+OUTLINE_WARM_COUNT = int(os.environ.get('INDEXER_OUTLINES', 8))
+
+# Larger sessions are left to be outlined on demand: a build is one
+# uninterrupted pass that holds the GIL, which would stall request threads.
+# Override with INDEXER_OUTLINE_MAX_BYTES.
+OUTLINE_WARM_MAX_BYTES = int(os.environ.get('INDEXER_OUTLINE_MAX_BYTES', 16 * 1024 * 1024))
+
+# Session list size warmed per project without a usable index
+# (the /api/sessions default)
+SESSION_LIST_LIMIT = 50
+
+_indexer = None
+
+class Indexer(threading.Thread):
+    """Daemon thread that scans ~/.claude/projects and warms caches."""
+
+    def __init__(self, projects_dir=None, interval=SCAN_INTERVAL, duty_cycle=DUTY_CYCLE):
+        super().__init__(name='indexer', daemon=True)
+        self.projects_dir = projects_dir or get_projects_dir()
+        self.interval = interval
+        self.duty_cycle = min(max(duty_cycle, 0.01), 1.0)
+        self.snapshots = {}  # project name -> {relative path: stat key}, once warmed
+        self.seen = {}       # project name -> snapshot from the previous scan
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._status = {
+            'state': 'starting',
+            'passes': 0,
+            'projectsTotal': 0,
+            'projectsQueued': 0,
+            'projectsWarmed': 0,
+            'lastPassWarmed': 0,
+            'projectsFailed': 0,
+            'filesTracked': 0,
+            'itemsWarmed': 0,
+            'lastScanAt': None,
+            'lastScanMs': 0,
+            'lastChanges': 0,
+            'errors': 0,
+            'lastError': None,
+            'interval': self.interval,
+            'dutyCycle': self.duty_cycle
+        }
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.scan_once()
+            except Exception as e:
+                traceback.print_exc()
+                self.record_error(str(e))
+
+            self.update(state='idle')
+            self._stop_event.wait(self.interval)
+
+        self.update(state='stopped')
+
+    def stop(self):
+        self._stop_event.set()
+
+    def status(self):
+        """Return a snapshot of progress counters."""
+        with self._lock:
+            return dict(self._status)
+
+    def update(self, **fields):
+        with self._lock:
+            self._status.update(fields)
+
+    def scan_once(self):
+        """Diff directory snapshots and warm caches for changed projects."""
+        started = time.monotonic()
+        self.update(state='scanning', lastScanAt=datetime.now().isoformat() + 'Z')
+
+        current = self.snapshot_projects()
+        if self._stop_event.is_set():
+            return  # partial snapshot; don't mistake unscanned projects for deleted ones
+
+        changed = [name for name, (_, snapshot) in current.items()
+                   if snapshot != self.snapshots.get(name)]
+        changed.sort(key=lambda name: current[name][0], reverse=True)
+
+        self.forget_removed(current)
+
+        self.update(
+            state='warming',
+            projectsTotal=len(current),
+            projectsQueued=len(changed),
+            projectsWarmed=len(self.snapshots),
+            lastPassWarmed=0,
+            projectsFailed=0,
+            filesTracked=sum(len(snapshot) for _, snapshot in current.values()),
+            lastChanges=len(changed)
+        )
+
+        warmed = failed = 0
+        for i, name in enumerate(changed, 1):
+            if self._stop_event.is_set():
+                return
+            # A project whose warm-up failed keeps its old snapshot, so it is
+            # retried on the next pass.
+            if self.warm_project(name, current[name][1]):
+                self.snapshots[name] = current[name][1]
+                warmed += 1
+            else:
+                failed += 1
+            self.update(
+                projectsWarmed=len(self.snapshots),
+                lastPassWarmed=warmed,
+                projectsFailed=failed,
+                projectsQueued=len(changed) - i
+            )
+
+        if changed:
+            self.warm_outlines()
+
+        self.update(
+            passes=self._status['passes'] + 1,
+            lastScanMs=int((time.monotonic() - started) * 1000)
+        )
+
+    def snapshot_projects(self):
+        """Return {project: (latest mtime, {relative path: stat key})}.
+
+        Each project's scan is paced like any other unit of work.
+        """
+        projects = {}
+
+        try:
+            entries = list(os.scandir(self.projects_dir))
+        except OSError:
+            return projects
+
+        for entry in entries:
+            if self._stop_event.is_set():
+                break
+            if entry.is_dir():
+                started = time.monotonic()
+                snapshot = snapshot_project(entry.path)
+                latest = max((key[0] for key in snapshot.values()), default=0)
+                projects[entry.name] = (latest, snapshot)
+                self.throttle(time.monotonic() - started)
+
+        return projects
+
+    def forget_removed(self, current):
+        """Drop snapshots and cached lookups for deleted projects and files."""
+        for name, snapshot in self.seen.items():
+            project_path = os.path.join(self.projects_dir, name)
+            if name not in current:
+                self.snapshots.pop(name, None)
+                forget_project(project_path)
+            else:
+                removed = set(snapshot) - set(current[name][1])
+                forget_paths(os.path.join(project_path, relative_path)
+                             for relative_path in removed)
+
+        self.seen = {name: snapshot for name, (_, snapshot) in current.items()}
+
+    def warm_project(self, name, snapshot):
+        """Refresh session listing and agent references for one project.
+
+        Returns True only if every step succeeded.
+        """
+        project_path = os.path.join(self.projects_dir, name)
+        ok = self.paced(count_sessions, project_path) is not None
+
+        # None from the index (e.g. jq is not installed) means requests fall
+        # back to a directory listing, so warm that instead.
+        sessions = None
+        if 'sessions-index.json' in snapshot:
+            index_path = os.path.join(project_path, 'sessions-index.json')
+            sessions = self.paced(load_sessions_from_index, index_path)
+        if sessions is None:
+            self.paced(list_sessions_from_directory, project_path, SESSION_LIST_LIMIT)
+
+        for relative_path in snapshot:
+            if self._stop_event.is_set():
+                return False
+            if os.path.basename(relative_path).startswith('agent-'):
+                agent_path = os.path.join(project_path, relative_path)
+                if self.paced(agent_session_ids, agent_path, True) is None:
+                    ok = False
+
+        return ok
+
+    def warm_outlines(self):
+        """Pre-build outlines for the most recently modified sessions."""
+        sessions = [
+            (key[0], os.path.join(self.projects_dir, name, relative_path))
+            for name, snapshot in self.snapshots.items()
+            for relative_path, key in snapshot.items()
+            if is_session_file(relative_path) and key[1] <= OUTLINE_WARM_MAX_BYTES
+        ]
+        sessions.sort(reverse=True)
+
+        for _, path in sessions[:OUTLINE_WARM_COUNT]:
+            if self._stop_event.is_set():
+                return
+            self.paced(build_outline, path)
+
+    def paced(self, func, *args):
+        """Run one unit of work, then sleep to stay within the duty cycle.
+
+        Returns the result, or None if the work raised.
+        """
+        started = time.monotonic()
+        result = None
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.record_error(f"{func.__name__}: {e}")
+
+        self.update(itemsWarmed=self._status['itemsWarmed'] + 1)
+        self.throttle(time.monotonic() - started)
+        return result
+
+    def throttle(self, elapsed):
+        """Sleep so that elapsed seconds of work stay within the duty cycle."""
+        self._stop_event.wait(elapsed * (1 - self.duty_cycle) / self.duty_cycle)
+
+    def record_error(self, message):
+        self.update(errors=self._status['errors'] + 1, lastError=message)
+
+def snapshot_project(project_path):
+    """Stat keys for session, index and agent files in a project directory."""
+    snapshot = {}
+
+    try:
+        entries = list(os.scandir(project_path))
+    except OSError:
+        return snapshot
+
+    for entry in entries:
+        if entry.is_file():
+            if entry.name.endswith('.jsonl') or entry.name == 'sessions-index.json':
+                snapshot[entry.name] = entry_stat_key(entry)
+        elif entry.is_dir():
+            subagents_dir = os.path.join(entry.path, 'subagents')
+            try:
+                agents = list(os.scandir(subagents_dir))
+            except OSError:
+                continue
+            for agent in agents:
+                if agent.name.endswith('.jsonl'):
+                    snapshot[os.path.join(entry.name, 'subagents', agent.name)] = entry_stat_key(agent)
+
+    return snapshot
+
+def entry_stat_key(entry):
+    try:
+        st = entry.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+def is_session_file(relative_path):
+    """Top-level <sessionId>.jsonl (not an agent file)."""
+    return (os.sep not in relative_path
+            and relative_path.endswith('.jsonl')
+            and not relative_path.startswith('agent-'))
+
+def start_indexer(**kwargs):
+    """Start the shared background indexer (once)."""
+    global _indexer
+    if _indexer is None:
+        _indexer = Indexer(**kwargs)
+        _indexer.start()
+    return _indexer
+
+def stop_indexer():
+    global _indexer
+    if _indexer is not None:
+        _indexer.stop()
+        _indexer = None
+
+def get_indexer():
+    """Return the running indexer, or None if it was not started."""
+    return _indexer
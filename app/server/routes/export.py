@@ -0,0 +1,36 @@
+"""Handler for /api/export endpoint - streaming Markdown/HTML export."""
+
+import os
+from ..utils.export import export_project_session, get_renderer
+from ..utils.security import validate_session_path
+
+def handle(handler, params):
+    """Stream a session (optionally with its agents) as Markdown or HTML."""
+    project = params.get('project')
+    session_id = params.get('sessionId')
+    fmt = params.get('format', 'md')  # 'md' or 'html'
+    include_agents = params.get('includeAgents') in ('1', 'true')
+    no_thinking = params.get('noThinking') in ('1', 'true')
+    
+    if not project or not session_id:
+        handler.send_error_json(400, "Missing required parameters")
+        return
+    
+    try:
+        renderer = get_renderer(fmt)
+    except ValueError as e:
+        handler.send_error_json(400, str(e))
+        return
+    
+    path = validate_session_path(project, session_id)
+    if not path:
+        handler.send_error_json(404, "Session not found")
+        return
+    
+    session_id = os.path.basename(session_id)
+    filename = f"session-{session_id[:8]}.{renderer.extension}"
+    
+    chunks = export_project_session(
+        os.path.dirname(path), session_id, fmt, include_agents, no_thinking
+    )
+    handler.send_stream(chunks, renderer.mime_type, filename)
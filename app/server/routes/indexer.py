@@ -0,0 +1,13 @@
+"""Handler for /api/indexer endpoint - background indexer progress."""
+
+from ..indexer import get_indexer
+
+def handle(handler, params):
+    """Report background indexer progress."""
+    indexer = get_indexer()
+    
+    if not indexer:
+        handler.send_json({'state': 'disabled'})
+        return
+    
+    handler.send_json(indexer.status())
@@ -1,13 +1,21 @@
 """Handler for /api/session endpoint."""
 
 import os
-from ..utils.jsonl import load_jsonl_file
+from ..utils.jsonl import load_jsonl_json
+from ..utils.compact import encode_jsonl_file
+from ..utils.outline import build_outline
 from ..utils.security import validate_session_path
 
 def handle(handler, params):
-    """Load a session file."""
+    """Load a session file.
+    
+    mode=outline returns only the conversation skeleton instead of events.
+    format=compact returns events in the compact wire format (see utils/compact.py).
+    """
     project = params.get('project')
     session_id = params.get('sessionId')
+    mode = params.get('mode', 'full')  # 'full' or 'outline'
+    wire_format = params.get('format', 'json')  # 'json' or 'compact'
     
     if not project or not session_id:
         handler.send_error_json(400, "Missing required parameters")
@@ -21,11 +29,34 @@ def handle(handler, params):
     # Expand path to absolute for client display
     absolute_path = os.path.abspath(os.path.expanduser(path))
     
-    events, errors = load_jsonl_file(path)
+    if mode == 'outline':
+        outline = build_outline(path)
+        handler.send_json({
+            'sessionId': session_id,
+            'project': project,
+            'path': absolute_path,
+            'mode': 'outline',
+            'outline': outline,
+            'errors': outline['errors']
+        })
+        return
+    
+    if wire_format == 'compact':
+        compact, errors = encode_jsonl_file(path)
+        handler.send_json({
+            'sessionId': session_id,
+            'project': project,
+            'path': absolute_path,
+            'format': 'compact',
+            'compact': compact,
+            'errors': errors
+        }, compact=True)
+        return
+    
+    events_json, errors = load_jsonl_json(path)
     handler.send_json({
         'sessionId': session_id,
         'project': project,
         'path': absolute_path,
-        'events': events,
         'errors': errors
-    })
+    }, raw={'events': events_json})
@@ -1,7 +1,8 @@
 """Handler for /api/subagent endpoint."""
 
 import os
-from ..utils.jsonl import load_jsonl_file
+from ..utils.jsonl import load_jsonl_json
+from ..utils.compact import encode_jsonl_file
 from ..utils.security import validate_subagent_path, validate_agent_path
 
 def handle(handler, params):
@@ -10,11 +11,14 @@ def handle(handler, params):
     Supports both flat and nested agent structures:
     - Flat: agent-*.jsonl in project root (type='flat')
     - Nested: session/subagents/agent-*.jsonl (type='nested', default)
+    
+    format=compact returns events in the compact wire format (see utils/compact.py).
     """
     project = params.get('project')
     session_id = params.get('sessionId')
     agent_id = params.get('agentId')
     agent_type = params.get('type', 'nested')  # 'flat' or 'nested'
+    wire_format = params.get('format', 'json')  # 'json' or 'compact'
     
     if not all([project, session_id, agent_id]):
         handler.send_error_json(400, "Missing required parameters")
@@ -34,13 +38,26 @@ def handle(handler, params):
     # Expand path to absolute for client display
     absolute_path = os.path.abspath(os.path.expanduser(path))
     
-    events, errors = load_jsonl_file(path)
+    if wire_format == 'compact':
+        compact, errors = encode_jsonl_file(path)
+        handler.send_json({
+            'agentId': agent_id,
+            'sessionId': session_id,
+            'project': project,
+            'type': agent_type,
+            'path': absolute_path,
+            'format': 'compact',
+            'compact': compact,
+            'errors': errors
+        }, compact=True)
+        return
+    
+    events_json, errors = load_jsonl_json(path)
     handler.send_json({
         'agentId': agent_id,
         'sessionId': session_id,
         'project': project,
         'type': agent_type,
         'path': absolute_path,
-        'events': events,
         'errors': errors
-    })
+    }, raw={'events': events_json})
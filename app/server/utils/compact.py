@@ -0,0 +1,124 @@
+"""Compact wire format for session events.
+
+Events repeat the same keys and many identical values (sessionId, cwd,
+version, gitBranch, model names, ...). The compact format encodes them as:
+
+    strings    - string table; keys and string values in objects are stored
+                 once (tool output is often repeated in toolUseResult)
+    shapes     - key layouts; each entry is (string index << 2) | kind
+    constants  - session-constant top-level fields hoisted out of the events
+    events     - one encoded value per event
+
+Encoded values:
+    object  -> [shape, value, ...]   (shape >= 0)
+    array   -> [-1, value, ...]
+    other   -> the JSON value itself (strings inside arrays stay inline)
+
+Slot kinds in a shape:
+    0  raw value in the tuple
+    1  string table index in the tuple
+    2  hoisted constant (no tuple slot; value is constants[key])
+
+APIClient.decodeCompact() in js/data/APIClient.js is the matching decoder.
+"""
+
+from .jsonl import iter_jsonl_events
+
+# Top-level fields that are normally the same for every event in a session.
+# A field is hoisted while it matches the first value seen; events where it
+# differs carry it inline.
+HOISTED_FIELDS = frozenset([
+    'sessionId', 'cwd', 'version', 'gitBranch', 'userType',
+    'isSidechain', 'entrypoint', 'agentId'
+])
+
+KIND_RAW = 0
+KIND_STRING = 1
+KIND_CONSTANT = 2
+
+ARRAY_MARKER = -1
+
+class CompactEncoder:
+    """Single-pass encoder; feed events with add() and call result()."""
+
+    def __init__(self):
+        self.strings = []
+        self.string_index = {}
+        self.shapes = []
+        self.shape_index = {}
+        self.constants = {}
+        self.events = []
+
+    def add(self, event):
+        if isinstance(event, dict):
+            self.events.append(self.encode_object(event, top_level=True))
+        else:
+            self.events.append(self.encode_value(event))
+
+    def result(self):
+        return {
+            'strings': self.strings,
+            'shapes': self.shapes,
+            'constants': self.constants,
+            'events': self.events
+        }
+
+    def intern(self, value):
+        index = self.string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self.string_index[value] = index
+        return index
+
+    def encode_object(self, obj, top_level=False):
+        shape = []
+        values = []
+
+        for key, value in obj.items():
+            key_index = self.intern(key) << 2
+
+            if top_level and self.is_constant(key, value):
+                shape.append(key_index | KIND_CONSTANT)
+            elif isinstance(value, str):
+                shape.append(key_index | KIND_STRING)
+                values.append(self.intern(value))
+            else:
+                shape.append(key_index | KIND_RAW)
+                values.append(self.encode_value(value))
+
+        shape = tuple(shape)
+        shape_id = self.shape_index.get(shape)
+        if shape_id is None:
+            shape_id = len(self.shapes)
+            self.shapes.append(shape)
+            self.shape_index[shape] = shape_id
+
+        return [shape_id] + values
+
+    def encode_value(self, value):
+        if isinstance(value, dict):
+            return self.encode_object(value)
+        if isinstance(value, list):
+            return [ARRAY_MARKER] + [self.encode_value(item) for item in value]
+        return value
+
+    def is_constant(self, key, value):
+        """Hoist session-constant fields that match the first value seen."""
+        if key not in HOISTED_FIELDS or isinstance(value, (dict, list)):
+            return False
+        if key not in self.constants:
+            self.constants[key] = value
+            return True
+        constant = self.constants[key]
+        return constant == value and type(constant) is type(value)
+
+def encode_jsonl_file(path):
+    """Parse and encode a JSONL file in one pass, returning (compact, errors)."""
+    encoder = CompactEncoder()
+    errors = []
+
+    for event in iter_jsonl_events(path, errors):
+        encoder.add(event)
+
+    return encoder.result(), errors
@@ -1,9 +1,28 @@
 """Session discovery utilities."""
 
 import os
+import re
 import json
+import glob
 import subprocess
 from datetime import datetime
+from .security import is_safe_path
+
+# Derived-data caches. Each entry is stored with the stat key of the file or
+# directory it was computed from, so a lookup is only reused while that is
+# unchanged. All are keyed by path; the background indexer (server/indexer.py)
+# fills them ahead of requests and drops entries for deleted files.
+_session_counts = {}      # project path -> (stat key, count)
+_index_sessions = {}      # index path -> (stat key, all sessions, newest first)
+_agent_session_ids = {}   # agent path -> (stat key, frozenset of sessionIds)
+
+def stat_key(path):
+    """Return (mtime_ns, size) for a path, or None if it cannot be read."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 def get_projects_dir():
     """Get projects directory path."""
@@ -19,10 +38,7 @@ def list_project_directories(projects_dir):
             continue
         
         # Count sessions
-        try:
-            session_count = len([f for f in os.listdir(path) if f.endswith('.jsonl')])
-        except (OSError, PermissionError):
-            session_count = 0
+        session_count = count_sessions(path)
         
         # Get modification time
         try:
@@ -42,6 +58,21 @@ def list_project_directories(projects_dir):
     projects.sort(key=lambda p: p['lastModified'], reverse=True)
     return projects
 
+def count_sessions(project_path):
+    """Count .jsonl files in a project, cached until the directory changes."""
+    key = stat_key(project_path)
+    cached = _session_counts.get(project_path)
+    if cached and key and cached[0] == key:
+        return cached[1]
+    
+    try:
+        count = len([f for f in os.listdir(project_path) if f.endswith('.jsonl')])
+    except (OSError, PermissionError):
+        return 0
+    
+    _session_counts[project_path] = (key, count)
+    return count
+
 def list_sessions_for_project(project_name, limit=50):
     """List sessions for a project using index or fallback."""
     projects_dir = get_projects_dir()
@@ -61,12 +92,32 @@ def list_sessions_for_project(project_name, limit=50):
     # Fallback to directory listing
     return list_sessions_from_directory(project_path, limit)
 
-def load_sessions_from_index(index_path, limit):
-    """Load sessions from sessions-index.json using jq."""
+def load_sessions_from_index(index_path, limit=None):
+    """Load sessions from sessions-index.json, cached until the index changes.
+    
+    The full sorted list is cached once per index and sliced per request.
+    Returns None if the index cannot be queried.
+    """
+    key = stat_key(index_path)
+    cached = _index_sessions.get(index_path)
+    if cached and key and cached[0] == key:
+        sessions = cached[1]
+    else:
+        sessions = query_sessions_index(index_path)
+        if sessions is None:
+            return None
+        if key:
+            _index_sessions[index_path] = (key, sessions)
+    
+    return sessions[:limit]
+
+def query_sessions_index(index_path, limit=None):
+    """Query sessions-index.json using jq (all entries if limit is None)."""
+    selector = '.[]' if limit is None else f'limit({int(limit)};.[])'
     try:
         cmd = [
             'jq', '-r',
-            f'.entries | sort_by(.fileMtime) | reverse | limit({limit};.[]) | '
+            f'.entries | sort_by(.fileMtime) | reverse | {selector} | '
             '@json',
             index_path
         ]
@@ -124,3 +175,118 @@ def list_sessions_from_directory(project_path, limit):
     # Sort by timestamp descending
     sessions.sort(key=lambda s: s['timestamp'], reverse=True)
     return sessions[:limit]
+
+def discover_agents(project_path, target_session_id):
+    """
+    Find all agents that reference the target session.
+    
+    Approach A: Read sessionId field from agent files to build relationships.
+    Supports both flat (project root) and nested (session/subagents/) structures.
+    """
+    agents = []
+    
+    # 1. Check flat agents (in project root)
+    flat_pattern = os.path.join(project_path, 'agent-*.jsonl')
+    for agent_path in glob.glob(flat_pattern):
+        if not is_safe_path(agent_path):
+            continue
+            
+        agent_id = extract_agent_id_from_path(agent_path)
+        if agent_id and session_references_match(agent_path, target_session_id):
+            agents.append({
+                'agentId': agent_id,
+                'path': agent_path,
+                'type': 'flat'
+            })
+    
+    # 2. Check nested agents (in session/subagents/)
+    subagents_dir = os.path.join(project_path, target_session_id, 'subagents')
+    if os.path.exists(subagents_dir) and os.path.isdir(subagents_dir):
+        nested_pattern = os.path.join(subagents_dir, 'agent-*.jsonl')
+        for agent_path in glob.glob(nested_pattern):
+            if not is_safe_path(agent_path):
+                continue
+                
+            agent_id = extract_agent_id_from_path(agent_path)
+            if agent_id:
+                # Nested agents implicitly belong to this session by directory structure
+                # But we still verify by checking sessionId in the file
+                if session_references_match(agent_path, target_session_id):
+                    agents.append({
+                        'agentId': agent_id,
+                        'path': agent_path,
+                        'type': 'nested'
+                    })
+    
+    return agents
+
+def extract_agent_id_from_path(path):
+    """Extract agent ID from filename like agent-a1b2c3d.jsonl"""
+    filename = os.path.basename(path)
+    match = re.match(r'^agent-([a-f0-9]{7})\.jsonl$', filename)
+    return match.group(1) if match else None
+
+def session_references_match(agent_path, target_session_id):
+    """
+    Check if an agent file references the target session.
+    
+    Returns True if any of the agent's first lines has a matching sessionId.
+    """
+    return target_session_id in agent_session_ids(agent_path)
+
+def agent_session_ids(agent_path, strict=False):
+    """
+    Return the sessionIds referenced by an agent file.
+    
+    Reads the first few lines of the agent file; the result is cached until
+    the file changes. Read errors give an empty set, or raise if strict.
+    """
+    key = stat_key(agent_path)
+    cached = _agent_session_ids.get(agent_path)
+    if cached and key and cached[0] == key:
+        return cached[1]
+    
+    session_ids = set()
+    try:
+        with open(agent_path, 'r', encoding='utf-8') as f:
+            # Read first 10 lines (usually enough to find sessionId)
+            for i, line in enumerate(f):
+                if i >= 10:
+                    break
+                    
+                line = line.strip()
+                if not line:
+                    continue
+                    
+                try:
+                    data = json.loads(line)
+                    if isinstance(data, dict) and isinstance(data.get('sessionId'), str):
+                        session_ids.add(data['sessionId'])
+                except json.JSONDecodeError:
+                    continue
+                    
+    except (IOError, OSError) as e:
+        if strict:
+            raise
+        print(f"Error reading agent file {agent_path}: {e}")
+        return frozenset()
+    
+    session_ids = frozenset(session_ids)
+    if key:
+        _agent_session_ids[agent_path] = (key, session_ids)
+    return session_ids
+
+def forget_paths(paths):
+    """Drop cached entries computed from the given files or directories."""
+    for path in paths:
+        _session_counts.pop(path, None)
+        _index_sessions.pop(path, None)
+        _agent_session_ids.pop(path, None)
+
+def forget_project(project_path):
+    """Drop every cached entry for a project directory and the files in it."""
+    prefix = os.path.join(project_path, '')
+    for cache in (_session_counts, _index_sessions, _agent_session_ids):
+        for path in list(cache):
+            if path == project_path or path.startswith(prefix):
+                cache.pop(path, None)
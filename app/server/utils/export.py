@@ -0,0 +1,417 @@
+"""Streaming session export to Markdown and HTML.
+
+Mirrors the browser-side MarkdownExporter/HTMLExporter, but works as a
+generator pipeline over the JSONL files so memory stays bounded:
+
+    iter_jsonl_events -> iter_nodes -> Renderer -> text chunks
+"""
+
+import os
+import json
+import html
+from collections import deque
+from datetime import timezone
+from .jsonl import iter_jsonl_events
+from .outline import content_items, as_text, duration_ms, parse_timestamp
+from .discovery import discover_agents
+
+# Limits on nodes held back while waiting for tool results; past either,
+# the oldest pending tool is emitted with status 'pending' anyway.
+MAX_BUFFERED_NODES = 1000
+MAX_BUFFERED_BYTES = 64 * 1024 * 1024
+
+# Node label/colour config, matching js/config/nodeTypes.js
+NODE_CONFIG = {
+    'user': {'label': 'USER', 'color': '#3B82F6', 'bgColor': 'rgba(59, 130, 246, 0.08)'},
+    'assistant': {'label': 'CLAUDE', 'color': '#10B981', 'bgColor': 'rgba(16, 185, 129, 0.08)'},
+    'tool_call': {'label': 'TOOL', 'color': '#F59E0B', 'bgColor': 'rgba(245, 158, 11, 0.08)'},
+    'subagent': {'label': 'AGENT', 'color': '#8B5CF6', 'bgColor': 'rgba(139, 92, 246, 0.08)'}
+}
+
+def export_session(path, renderer, session_id=None, agents=(), no_thinking=False):
+    """Yield the rendered document for a session file and its agent files.
+
+    agents is an iterable of {'agentId', 'path'} dicts as returned by
+    discover_agents().
+    """
+    meta = read_session_metadata(path)
+    meta['sessionId'] = session_id or os.path.basename(path)[:-6]
+
+    yield renderer.header(meta)
+
+    for node, depth in iter_nodes(iter_jsonl_events(path)):
+        yield renderer.node(node, depth, no_thinking)
+
+    for agent in agents:
+        agent_meta = read_session_metadata(agent['path'])
+        yield renderer.node({
+            'type': 'subagent',
+            'timestamp': agent_meta['timestamp'],
+            'name': f"Agent {agent['agentId']}",
+            'task': agent_meta['firstPrompt'][:100] or 'Sub-agent task'
+        }, 0, no_thinking)
+
+        for node, depth in iter_nodes(iter_jsonl_events(agent['path']), 1):
+            yield renderer.node(node, depth, no_thinking)
+
+    yield renderer.footer()
+
+def export_project_session(project_path, session_id, fmt, include_agents=False, no_thinking=False):
+    """Yield the rendered document for a session in a project directory."""
+    path = os.path.join(project_path, f"{session_id}.jsonl")
+    agents = discover_agents(project_path, session_id) if include_agents else ()
+    return export_session(path, get_renderer(fmt), session_id, agents, no_thinking)
+
+def read_session_metadata(path):
+    """Read timestamp, model and first prompt from the start of a file."""
+    meta = {'timestamp': None, 'model': None, 'firstPrompt': ''}
+
+    for event in iter_jsonl_events(path):
+        if not isinstance(event, dict):
+            continue
+
+        if not meta['timestamp']:
+            meta['timestamp'] = event.get('timestamp')
+
+        if event.get('type') == 'user' and not meta['firstPrompt']:
+            meta['firstPrompt'] = '\n'.join(
+                as_text(item.get('text')) for item in content_items(event)
+                if item.get('type') == 'text'
+            )
+        elif event.get('type') == 'assistant':
+            message = event.get('message')
+            model = as_text(message.get('model')) if isinstance(message, dict) else ''
+            if model and not model.startswith('<'):  # skip '<synthetic>'
+                meta['model'] = model
+
+        if meta['model'] and meta['firstPrompt']:
+            break
+
+    meta['model'] = meta['model'] or 'claude-sonnet-4'
+    return meta
+
+def iter_nodes(events, base_depth=0):
+    """Yield (node, depth) pairs in document order, as TreeTransformer nests them.
+
+    Tool nodes are completed from later tool_result events, so nodes are
+    queued until every tool ahead of them has its result. The queue is capped
+    by MAX_BUFFERED_NODES and MAX_BUFFERED_BYTES.
+    """
+    queue = deque()
+    queued_bytes = 0
+    pending_tools = {}
+    in_user_turn = False
+
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+
+        event_type = event.get('type')
+        timestamp = event.get('timestamp')
+
+        if event_type == 'user':
+            text = []
+            for item in content_items(event):
+                if item.get('type') == 'text':
+                    text.append(as_text(item.get('text')))
+                elif item.get('type') == 'tool_result':
+                    tool_use_id = item.get('tool_use_id')
+                    tool = pending_tools.pop(tool_use_id, None) if isinstance(tool_use_id, str) else None
+                    if tool:
+                        complete_tool(tool, item, timestamp)
+                        queued_bytes += len(tool['output'])
+
+            if text:
+                node = {
+                    'type': 'user',
+                    'timestamp': timestamp,
+                    'content': '\n'.join(text)
+                }
+                queue.append((node, base_depth))
+                queued_bytes += node_size(node)
+                in_user_turn = True
+
+        elif event_type == 'assistant':
+            depth = base_depth + (1 if in_user_turn else 0)
+            node = {
+                'type': 'assistant',
+                'timestamp': timestamp,
+                'content': '',
+                'thinking': None
+            }
+            text = []
+            tools = []
+
+            for item in content_items(event):
+                item_type = item.get('type')
+                if item_type == 'text':
+                    text.append(as_text(item.get('text')))
+                elif item_type == 'thinking':
+                    node['thinking'] = as_text(item.get('thinking')) or None
+                elif item_type == 'tool_use':
+                    tool = {
+                        'id': item.get('id'),
+                        'type': 'tool_call',
+                        'timestamp': timestamp,
+                        'name': item.get('name'),
+                        'input': item.get('input') or {},
+                        'status': 'pending',
+                        'output': '',
+                        'duration': 0,
+                        'error': None
+                    }
+                    tool['inputSize'] = len(json.dumps(tool['input']))
+                    if isinstance(tool['id'], str):
+                        pending_tools[tool['id']] = tool
+                    tools.append((tool, depth + 1))
+
+            node['content'] = '\n'.join(text)
+            queue.append((node, depth))
+            queue.extend(tools)
+            queued_bytes += node_size(node) + sum(node_size(tool) for tool, _ in tools)
+
+        while queue:
+            head = queue[0][0]
+            if head['type'] == 'tool_call' and head['status'] == 'pending':
+                if len(queue) <= MAX_BUFFERED_NODES and queued_bytes <= MAX_BUFFERED_BYTES:
+                    break
+                # Its result can no longer be attached once it is emitted
+                if isinstance(head['id'], str):
+                    pending_tools.pop(head['id'], None)
+            queued_bytes -= node_size(head)
+            yield queue.popleft()
+
+    while queue:
+        yield queue.popleft()
+
+def node_size(node):
+    """Approximate size in characters of a node's content."""
+    return (len(node.get('content') or '') + len(node.get('thinking') or '')
+            + node.get('inputSize', 0) + len(node.get('output') or ''))
+
+def complete_tool(tool, result, timestamp):
+    """Fill a tool node from its tool_result item."""
+    if not tool:
+        return
+
+    is_error = result.get('is_error') or False
+    tool['output'] = extract_content(result.get('content'))
+    tool['status'] = 'error' if is_error else 'success'
+    tool['duration'] = duration_ms(tool['timestamp'], timestamp)
+    if is_error:
+        tool['error'] = tool['output']
+
+def extract_content(content):
+    """Extract text from a tool_result content value."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return '\n'.join(
+            as_text(item.get('text')) for item in content
+            if isinstance(item, dict) and item.get('type') == 'text'
+        )
+    return ''
+
+def format_timestamp(value):
+    """Format an ISO timestamp like the frontend's formatTimestamp().
+
+    Unparseable strings are returned as-is (escape them for HTML); any other
+    value gives 'Unknown time'.
+    """
+    if not value or not isinstance(value, str):
+        return 'Unknown time'
+    try:
+        date = parse_timestamp(value)
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return date.astimezone().strftime('%m/%d/%Y, %H:%M:%S')
+    except (ValueError, OverflowError, OSError):
+        return value
+
+def get_renderer(fmt):
+    """Return a renderer instance for 'md'/'markdown' or 'html'."""
+    renderer = RENDERERS.get(fmt)
+    if not renderer:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return renderer()
+
+class MarkdownRenderer:
+    """Markdown output, matching MarkdownExporter.js."""
+
+    mime_type = 'text/markdown'
+    extension = 'md'
+
+    def header(self, meta):
+        return '\n'.join([
+            '# Session Reconstruction\n',
+            f"**Session ID**: `{meta['sessionId']}`",
+            f"**Model**: {meta['model']}",
+            f"**Date**: {format_timestamp(meta['timestamp'])}\n",
+            '---\n',
+            ''
+        ])
+
+    def node(self, node, depth, no_thinking=False):
+        indent = '> ' * depth
+        lines = []
+
+        if node['type'] == 'user':
+            lines.append(f"{indent}## User ({format_timestamp(node['timestamp'])})")
+            lines.append(f"{indent}{node['content']}")
+            lines.append('')
+
+        elif node['type'] == 'assistant':
+            lines.append(f"{indent}## Claude ({format_timestamp(node['timestamp'])})")
+
+            if node['thinking'] and not no_thinking:
+                lines.append(f"{indent}> [!NOTE] Thinking Process")
+                for line in node['thinking'].split('\n'):
+                    lines.append(f"{indent}> {line}")
+                lines.append('')
+
+            lines.append(f"{indent}{node['content']}")
+            lines.append('')
+
+        elif node['type'] == 'tool_call':
+            lines.append(f"{indent}**Tool**: `{node['name']}` ({node['status']})")
+            lines.append(f"{indent}```json")
+            lines.append(f"{indent}{json.dumps(node['input'], indent=2, ensure_ascii=False)}")
+            lines.append(f"{indent}```")
+
+            if node['output']:
+                lines.append(f"{indent}**Result**:")
+                lines.append(f"{indent}```")
+                lines.append(f"{indent}{node['output']}")
+                lines.append(f"{indent}```")
+
+            if node['error']:
+                lines.append(f"{indent}**Error**: {node['error']}")
+            lines.append('')
+
+        elif node['type'] == 'subagent':
+            lines.append(f"{indent}---")
+            lines.append(f"{indent}**Sub-Agent**: {node['name']}")
+            lines.append(f"{indent}**Task**: {node['task']}")
+            lines.append(f"{indent}---")
+            lines.append('')
+
+        return '\n'.join(lines) + '\n'
+
+    def footer(self):
+        return ''
+
+class HTMLRenderer:
+    """HTML output, matching HTMLExporter.js.
+
+    Nodes are emitted as flat, indented blocks so the document can be
+    written before the whole tree is known.
+    """
+
+    mime_type = 'text/html'
+    extension = 'html'
+
+    def header(self, meta):
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Session {escape(meta['sessionId'])}</title>
+  <style>{STYLES}</style>
+</head>
+<body>
+  <div class="session-export">
+    <header>
+      <h1>Session Reconstruction</h1>
+      <div class="metadata">
+        <div><strong>Session ID:</strong> {escape(meta['sessionId'])}</div>
+        <div><strong>Model:</strong> {escape(meta['model'])}</div>
+        <div><strong>Date:</strong> {escape(format_timestamp(meta['timestamp']))}</div>
+      </div>
+    </header>
+
+    <div class="content">
+"""
+
+    def node(self, node, depth, no_thinking=False):
+        config = NODE_CONFIG[node['type']]
+        parts = [
+            f'<div class="node node-{node["type"]}" style="margin-left: {depth * 20}px; '
+            f'border-left-color: {config["color"]};">'
+        ]
+
+        if node['type'] in ('user', 'assistant'):
+            parts.append(f"""<div class="node-header" style="background-color: {config['bgColor']};">
+          <span class="node-label" style="color: {config['color']};">{config['label']}</span>
+          <span class="node-time">{escape(format_timestamp(node['timestamp']))}</span>
+        </div>""")
+
+            if node['type'] == 'assistant' and node['thinking'] and not no_thinking:
+                parts.append(f"""<div class="thinking-block">
+            <strong>Thinking:</strong>
+            <pre>{escape(node['thinking'])}</pre>
+          </div>""")
+
+            parts.append(f'<div class="node-content">{escape(node["content"]).replace(chr(10), "<br>")}</div>')
+
+        elif node['type'] == 'tool_call':
+            parts.append(f"""<div class="node-header" style="background-color: {config['bgColor']};">
+          <span class="node-label" style="color: {config['color']};">{config['label']}: {escape(node['name'])}</span>
+          <span class="node-status status-{node['status']}">{node['status']}</span>
+        </div>""")
+            parts.append(f"""<div class="tool-details">
+          <strong>Input:</strong>
+          <pre>{escape(json.dumps(node['input'], indent=2, ensure_ascii=False))}</pre>
+          <strong>Output:</strong>
+          <pre>{escape(node['output'])}</pre>
+        </div>""")
+
+        elif node['type'] == 'subagent':
+            parts.append(f"""<div class="node-header" style="background-color: {config['bgColor']};">
+          <span class="node-label" style="color: {config['color']};">{config['label']}: {escape(node['name'])}</span>
+        </div>""")
+            parts.append(f'<div class="node-content"><strong>Task:</strong> {escape(node["task"])}</div>')
+
+        parts.append('</div>\n')
+        return ''.join(parts)
+
+    def footer(self):
+        return """    </div>
+  </div>
+</body>
+</html>"""
+
+def escape(text):
+    """Escape like the frontend's escapeHtml() (textContent -> innerHTML)."""
+    return html.escape(str(text or ''), quote=False)
+
+RENDERERS = {
+    'md': MarkdownRenderer,
+    'markdown': MarkdownRenderer,
+    'html': HTMLRenderer
+}
+
+STYLES = """
+      * { box-sizing: border-box; margin: 0; padding: 0; }
+      body { font-family: -apple-system, sans-serif; background: #0a0a0b; color: #e4e4e7; padding: 20px; }
+      .session-export { max-width: 1200px; margin: 0 auto; }
+      header { margin-bottom: 30px; padding-bottom: 20px; border-bottom: 1px solid #27272a; }
+      h1 { font-size: 24px; margin-bottom: 15px; }
+      .metadata { display: flex; gap: 20px; font-size: 14px; color: #a1a1aa; }
+      .content { display: flex; flex-direction: column; gap: 10px; }
+      .node { border-left: 3px solid; padding: 12px; background: #18181b; border-radius: 4px; }
+      .node-header { display: flex; justify-content: space-between; padding: 8px; border-radius: 4px; margin-bottom: 8px; }
+      .node-label { font-weight: 600; font-size: 12px; text-transform: uppercase; }
+      .node-time { font-size: 11px; color: #71717a; }
+      .node-content { padding: 8px; line-height: 1.6; }
+      .node-status { font-size: 11px; padding: 2px 6px; border-radius: 3px; background: #27272a; }
+      .status-error { color: #ef4444; }
+      .status-success { color: #10b981; }
+      .thinking-block { background: rgba(16, 185, 129, 0.1); padding: 12px; border-radius: 4px; margin: 8px 0; }
+      .thinking-block strong { color: #10b981; }
+      .thinking-block pre { margin-top: 8px; white-space: pre-wrap; font-size: 12px; }
+      .tool-details { padding: 8px; }
+      .tool-details strong { display: block; margin-top: 12px; margin-bottom: 4px; color: #a1a1aa; }
+      .tool-details pre { background: #0a0a0b; padding: 12px; border-radius: 4px; overflow-x: auto; font-size: 12px; }
+      .empty-message { color: #71717a; font-style: italic; }
+    """
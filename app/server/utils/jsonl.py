@@ -1,6 +1,22 @@
 """JSONL file handling utilities."""
 
+import os
 import json
+import mmap
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Files at or above this size are validated in parallel chunks.
+# Override with JSONL_PARALLEL_THRESHOLD (bytes).
+PARALLEL_THRESHOLD = int(os.environ.get('JSONL_PARALLEL_THRESHOLD', 64 * 1024 * 1024))
+
+# Chunks smaller than this are not worth shipping to a worker process.
+MIN_CHUNK_SIZE = 4 * 1024 * 1024
+
+_executor = None
+_executor_lock = threading.Lock()
 
 def load_jsonl_file(path):
     """Load JSONL file, returning events and errors."""
@@ -23,3 +39,152 @@ def load_jsonl_file(path):
                 })
     
     return events, errors
+
+def load_jsonl_json(path, parallel_threshold=None):
+    """Load JSONL file as an encoded JSON array, returning (pieces, errors).
+
+    pieces is a list of bytes that together form the array, for responses
+    that only re-serialize the events (see handler.send_json raw=). Files larger than
+    parallel_threshold (default PARALLEL_THRESHOLD) are validated in a
+    process pool and the valid lines are spliced into the array as-is, so
+    no event is decoded or pickled in this process.
+    """
+    if parallel_threshold is None:
+        parallel_threshold = PARALLEL_THRESHOLD
+
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+
+    if size and size >= parallel_threshold and _worker_count() > 1:
+        try:
+            return load_jsonl_json_parallel(path, size)
+        except BrokenProcessPool:
+            _reset_executor()
+
+    events, errors = load_jsonl_file(path)
+    return [json.dumps(events).encode('utf-8')], errors
+
+def iter_jsonl_events(path, errors=None):
+    """Yield events one at a time; parse errors are appended to errors."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                if errors is not None:
+                    errors.append({
+                        'line': line_num,
+                        'error': str(e)
+                    })
+
+def load_jsonl_json_parallel(path, size=None):
+    """Validate newline-aligned chunks in worker processes and join them.
+
+    Workers return their valid lines pre-joined as a JSON array fragment;
+    the fragments are returned as array pieces without copying them again.
+    Error line numbers are global.
+    """
+    if size is None:
+        size = os.path.getsize(path)
+
+    ranges = split_chunks(path, size, _worker_count())
+
+    pieces = [b'[']
+    errors = []
+    first_line = 1
+
+    for fragment, chunk_errors, line_count in _get_executor().map(
+            _validate_chunk, [path] * len(ranges), *zip(*ranges)):
+        if fragment:
+            if len(pieces) > 1:
+                pieces.append(b',')
+            pieces.append(fragment)
+        for error in chunk_errors:
+            error['line'] += first_line - 1
+            errors.append(error)
+        first_line += line_count
+
+    pieces.append(b']')
+    return pieces, errors
+
+def split_chunks(path, size, count):
+    """Return (start, end) byte ranges that end just after a newline."""
+    chunk_size = max(size // max(count, 1), MIN_CHUNK_SIZE)
+    ranges = []
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                newline = mm.find(b'\n', min(start + chunk_size, size) - 1)
+                end = size if newline == -1 else newline + 1
+                ranges.append((start, end))
+                start = end
+
+    return ranges
+
+def _validate_chunk(path, start, end):
+    """Worker: validate lines in [start, end), numbering them from 1.
+
+    Returns the valid lines joined with commas, the errors and the number
+    of lines in the chunk.
+    """
+    valid = []
+    errors = []
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[start:end]
+
+    lines = data.split(b'\n')
+    if data.endswith(b'\n'):
+        lines.pop()
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            json.loads(line.decode('utf-8'))
+            valid.append(line)
+        except json.JSONDecodeError as e:
+            errors.append({
+                'line': line_num,
+                'error': str(e)
+            })
+
+    return b','.join(valid), errors, len(lines)
+
+def _worker_count():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _get_executor():
+    """Lazily create the shared process pool.
+
+    Workers are started with forkserver/spawn rather than fork, since the
+    server process runs other threads (the background indexer).
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _executor = ProcessPoolExecutor(max_workers=_worker_count(), mp_context=context)
+        return _executor
+
+def _reset_executor():
+    """Drop a broken pool so the next large file gets a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
@@ -0,0 +1,244 @@
+"""Session outline extraction.
+
+Builds the conversation skeleton (user prompts, assistant turns, tool calls
+and agent spawn points) in a single pass without keeping message content.
+"""
+
+import os
+import re
+import json
+from datetime import datetime
+from functools import lru_cache
+
+# Characters of each user prompt kept as a preview
+PREVIEW_LENGTH = 200
+
+# Tools that spawn a sub-agent
+AGENT_TOOLS = ('Task', 'Agent')
+
+# Structural patterns used to skim tool_result lines without decoding them.
+# Quotes inside JSON string values are always escaped, so these only match
+# real keys. Skimmed lines must still look like a complete object (see
+# looks_complete), so a truncated line is decoded, reported as an error and
+# does not shift the event indexes.
+TOOL_RESULT_RE = re.compile(rb'"type"\s*:\s*"tool_result"')
+TOOL_USE_ID_RE = re.compile(rb'"tool_use_id"\s*:\s*"([^"\\]+)"')
+IS_ERROR_RE = re.compile(rb'"is_error"\s*:\s*(true|false)')
+TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"\\]+)"')
+TEXT_ITEM_RE = re.compile(rb'"type"\s*:\s*"text"')
+
+def build_outline(path):
+    """Return the outline for a session file, cached per (path, mtime, size)."""
+    stat = os.stat(path)
+    return _build_outline_cached(path, stat.st_mtime, stat.st_size)
+
+@lru_cache(maxsize=32)
+def _build_outline_cached(path, mtime, size):
+    builder = OutlineBuilder()
+
+    with open(path, 'rb') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                builder.add_line(line, line_num)
+
+    return builder.result()
+
+class OutlineBuilder:
+    """Accumulates outline nodes, mirroring TreeTransformer's nesting."""
+
+    def __init__(self):
+        self.turns = []
+        self.errors = []
+        self.pending_tools = {}
+        self.current_user = None
+        self.event_count = 0
+        self.tool_count = 0
+        self.agent_count = 0
+
+    def add_line(self, line, line_num):
+        result = skim_tool_result(line)
+        if result:
+            self.event_count += 1
+            self.finish_tool(*result)
+            return
+
+        try:
+            event = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            self.errors.append({
+                'line': line_num,
+                'error': str(e)
+            })
+            return
+
+        index = self.event_count
+        self.event_count += 1
+
+        # Valid JSON that is not an object is still an event in the full
+        # response, so it keeps its index but has nothing to outline.
+        if not isinstance(event, dict):
+            return
+
+        if event.get('type') == 'user':
+            self.add_user(event, index)
+        elif event.get('type') == 'assistant':
+            self.add_assistant(event, index)
+
+    def add_user(self, event, index):
+        timestamp = event.get('timestamp')
+        text = []
+
+        for item in content_items(event):
+            if item.get('type') == 'text':
+                text.append(as_text(item.get('text')))
+            elif item.get('type') == 'tool_result':
+                self.finish_tool(item.get('tool_use_id'), item.get('is_error') or False, timestamp)
+
+        if text:
+            prompt = '\n'.join(text)
+            self.current_user = {
+                'type': 'user',
+                'index': index,
+                'timestamp': timestamp,
+                'preview': prompt[:PREVIEW_LENGTH],
+                'length': len(prompt),
+                'children': []
+            }
+            self.turns.append(self.current_user)
+
+    def add_assistant(self, event, index):
+        timestamp = event.get('timestamp')
+        node = {
+            'type': 'assistant',
+            'index': index,
+            'timestamp': timestamp,
+            'hasText': False,
+            'hasThinking': False,
+            'children': []
+        }
+
+        for item in content_items(event):
+            item_type = item.get('type')
+            if item_type == 'text':
+                node['hasText'] = True
+            elif item_type == 'thinking':
+                node['hasThinking'] = True
+            elif item_type == 'tool_use':
+                node['children'].append(self.start_tool(item, index, timestamp))
+
+        if self.current_user:
+            self.current_user['children'].append(node)
+        else:
+            self.turns.append(node)
+
+    def start_tool(self, item, index, timestamp):
+        tool = {
+            'type': 'tool_call',
+            'index': index,
+            'timestamp': timestamp,
+            'name': item.get('name'),
+            'status': 'pending',
+            'duration': 0
+        }
+
+        if tool['name'] in AGENT_TOOLS:
+            tool_input = item.get('input')
+            if not isinstance(tool_input, dict):
+                tool_input = {}
+            tool['spawnsAgent'] = True
+            tool['description'] = str(tool_input.get('description') or '')[:PREVIEW_LENGTH]
+            tool['subagentType'] = tool_input.get('subagent_type')
+            self.agent_count += 1
+
+        self.tool_count += 1
+        if isinstance(item.get('id'), str):
+            self.pending_tools[item['id']] = tool
+        return tool
+
+    def finish_tool(self, tool_use_id, is_error, timestamp):
+        if not isinstance(tool_use_id, str):
+            return
+        tool = self.pending_tools.pop(tool_use_id, None)
+        if not tool:
+            return
+
+        tool['status'] = 'error' if is_error else 'success'
+        tool['duration'] = duration_ms(tool['timestamp'], timestamp)
+
+    def result(self):
+        return {
+            'eventCount': self.event_count,
+            'toolCount': self.tool_count,
+            'agentCount': self.agent_count,
+            'turns': self.turns,
+            'errors': self.errors
+        }
+
+def skim_tool_result(line):
+    """Extract (tool_use_id, is_error, timestamp) from a raw tool_result line.
+
+    Returns None when the line is not a plain single tool_result, in which
+    case the caller falls back to a full decode.
+    """
+    if not TOOL_RESULT_RE.search(line) or TEXT_ITEM_RE.search(line):
+        return None
+
+    if not looks_complete(line):
+        return None
+
+    if len(TOOL_RESULT_RE.findall(line)) != 1:
+        return None
+
+    ids = TOOL_USE_ID_RE.findall(line)
+    errors = IS_ERROR_RE.findall(line)
+    timestamps = TIMESTAMP_RE.findall(line)
+    if len(ids) != 1 or len(errors) > 1 or len(timestamps) != 1:
+        return None
+
+    return (
+        ids[0].decode('utf-8'),
+        errors == [b'true'],
+        timestamps[0].decode('utf-8')
+    )
+
+def looks_complete(line):
+    """Cheap structural check that a line is a whole JSON object.
+
+    Brackets inside string values can unbalance the counts; such lines are
+    simply decoded in full.
+    """
+    return (line.startswith(b'{') and line.endswith(b'}')
+            and line.count(b'{') == line.count(b'}')
+            and line.count(b'[') == line.count(b']'))
+
+def content_items(event):
+    """Return message content as a list of items."""
+    message = event.get('message')
+    if not isinstance(message, dict):
+        return []
+    content = message.get('content') or []
+    if isinstance(content, list):
+        return [item for item in content if isinstance(item, dict)]
+    if isinstance(content, str):
+        return [{'type': 'text', 'text': content}]
+    return []
+
+def as_text(value):
+    """Return value if it is a string, otherwise ''."""
+    return value if isinstance(value, str) else ''
+
+def duration_ms(start, end):
+    """Milliseconds between two ISO timestamps, 0 if either is unparseable."""
+    if not isinstance(start, str) or not isinstance(end, str):
+        return 0
+    try:
+        delta = parse_timestamp(end) - parse_timestamp(start)
+    except (TypeError, ValueError):
+        return 0
+    return max(0, int(delta.total_seconds() * 1000))
+
+def parse_timestamp(value):
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)